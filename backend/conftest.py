@@ -0,0 +1,11 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient shared by all tests in the session."""
+    with TestClient(main.app) as test_client:
+        yield test_client
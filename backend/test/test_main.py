@@ -1,11 +1,4 @@
-from fastapi.testclient import TestClient
-
-from backend import main
-
-client = TestClient(main.app)
-
-
-def test_read_main():
+def test_read_main(client):
     """Test the read_main function."""
     response = client.get("/")
     assert response.status_code == 200
@@ -2,19 +2,17 @@
 
 """Entrypoint for Inductor Infrastructure."""
 
-import pulumi_aws as aws
 import pulumi_awsx as awsx
 
 import config
 from util import ecs_ec2, lb, rds
 # sa
 # Network
-availability_zone_names = aws.get_availability_zones(
-    state="available"
-).names[:config.NUMBER_OF_AVAILABILITY_ZONES]
+# The availability zones are resolved by the awsx provider so the lookup does
+# not block this program before resources can be registered.
 vpc = awsx.ec2.Vpc(
     config.RESOURCE_NAME_PREFIX + "-vpc",
-    availability_zone_names=availability_zone_names,
+    number_of_availability_zones=config.NUMBER_OF_AVAILABILITY_ZONES,
     nat_gateways=awsx.ec2.NatGatewayConfigurationArgs(strategy="None")
 )
 # load_balancer = lb.LoadBalancer(
@@ -4,6 +4,9 @@ Converts Pulumi configuration into Python variables and dataclasses.
 Contains information about the configurable parameters.
 Sets default values for parameters that are expected to be the same for
 most stacks (dev, staging, prod).
+
+The configuration dataclasses are frozen since the configuration is read-only
+once it has been loaded from the Pulumi stack.
 """
 
 import dataclasses
@@ -49,7 +52,7 @@ DOCKER_BUILD_SOURCE = os.path.abspath(
     pulumi_config.get("docker_build_source", default="../backend"))
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, eq=False, slots=True)
 class ECSConfig:
     """ECS configuration.
     
@@ -70,7 +73,7 @@ class ECSConfig:
 ecs = ECSConfig(**pulumi_config.get_object("ecs", default={}))
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, eq=False, slots=True)
 class LBConfig:
     """Load balancer configuration.
 
@@ -92,7 +95,7 @@ class LBConfig:
 lb = LBConfig(**pulumi_config.get_object("lb", default={}))
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, eq=False, slots=True)
 class EC2Config:
     """EC2 configuration.
 
@@ -114,7 +117,7 @@ class EC2Config:
 ecs_ec2 = EC2Config(**pulumi_config.get_object("ecs_ec2", default={}))
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, eq=False, slots=True)
 class RDSConfig:
     """RDS configuration.
 
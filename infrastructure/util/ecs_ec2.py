@@ -13,6 +13,40 @@ import pulumi_aws as aws
 import config
 
 
+# Trust policies are constant, so they are serialized once at import rather
+# than each time a component is created.
+_EC2_ASSUME_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement":
+        [
+            {
+                "Sid": "",
+                "Effect": "Allow",
+                "Principal": {"Service": "ec2.amazonaws.com"},
+                "Action": "sts:AssumeRole"
+            }
+        ],
+    },
+    separators=(",", ":")
+)
+_ECS_TASKS_ASSUME_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement":
+        [
+            {
+                "Sid": "",
+                "Effect": "Allow",
+                "Principal": {"Service": "ecs-tasks.amazonaws.com"},
+                "Action": "sts:AssumeRole"
+            }
+        ],
+    },
+    separators=(",", ":")
+)
+
+
 class Cluster(pulumi.ComponentResource):
     """ECS Cluster Component Resource"""
 
@@ -53,80 +87,62 @@ class Cluster(pulumi.ComponentResource):
             self.resource_name_prefix,
             {},
             opts)
+        self._child_opts = pulumi.ResourceOptions(parent=self)
+        prefix = self.resource_name_prefix
 
         # Security Group
         # - EC2 instance can only be accessed via the load balancer.
         self.security_group = aws.ec2.SecurityGroup(
-            self.resource_name_prefix + "-sg",
+            prefix + "-sg",
             vpc_id=vpc_id,
             description="Inbound: HTTP from LB. Outbound: Any.",
-            opts=pulumi.ResourceOptions(parent=self)
-        )
-        aws.ec2.SecurityGroupRule(
-            self.resource_name_prefix + "-sg-ingress",
-            type="ingress",
-            from_port=80,
-            to_port=80,
-            protocol="tcp",
-            cidr_blocks=["0.0.0.0/0"],
-            ipv6_cidr_blocks=["::/0"],
-            security_group_id=self.security_group.id,
-            opts=pulumi.ResourceOptions(parent=self)
-        )
-        aws.ec2.SecurityGroupRule(
-            self.resource_name_prefix + "-sg-engress",
-            type="egress",
-            from_port=0,
-            to_port=0,
-            protocol="-1",
-            cidr_blocks=["0.0.0.0/0"],
-            ipv6_cidr_blocks=["::/0"],
-            security_group_id=self.security_group.id,
-            opts=pulumi.ResourceOptions(parent=self)
+            ingress=[
+                aws.ec2.SecurityGroupIngressArgs(
+                    from_port=80,
+                    to_port=80,
+                    protocol="tcp",
+                    cidr_blocks=["0.0.0.0/0"],
+                    ipv6_cidr_blocks=["::/0"]),
+            ],
+            egress=[
+                aws.ec2.SecurityGroupEgressArgs(
+                    from_port=0,
+                    to_port=0,
+                    protocol="-1",
+                    cidr_blocks=["0.0.0.0/0"],
+                    ipv6_cidr_blocks=["::/0"]),
+            ],
+            opts=self._child_opts
         )
 
         # IAM Role and Profile
         # - Permissions for the EC2 instances to connect to the ECS cluster.
         self.ecs_instance_role = aws.iam.Role(
-            self.resource_name_prefix + "ecs-instance-role",
-            assume_role_policy=json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement":
-                    [
-                        {
-                            "Sid": "",
-                            "Effect": "Allow",
-                            "Principal": {"Service": "ec2.amazonaws.com"},
-                            "Action": "sts:AssumeRole"
-                        }
-                    ],
-                }
-            ),
-            opts=pulumi.ResourceOptions(parent=self)
+            prefix + "ecs-instance-role",
+            assume_role_policy=_EC2_ASSUME_ROLE_POLICY,
+            opts=self._child_opts
         )
         self.ecs_instance_role_policy_attach = aws.iam.RolePolicyAttachment(
-            self.resource_name_prefix + "ecs-instance-policy-attach",
+            prefix + "ecs-instance-policy-attach",
             role=self.ecs_instance_role.name,
             policy_arn="arn:aws:iam::aws:policy/service-role/AmazonEC2ContainerServiceforEC2Role",
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
         self.ecs_instance_profile = aws.iam.InstanceProfile(
-            self.resource_name_prefix + "ecs-iam-instance-profile",
+            prefix + "ecs-iam-instance-profile",
             role=self.ecs_instance_role.name,
-            opts=pulumi.ResourceOptions(parent=self))
+            opts=self._child_opts)
 
         # User Data
         # - Connects the EC2 instances to the ECS cluster.
-        ec2_user_data = textwrap.dedent(f"""
+        ec2_user_data = textwrap.dedent(f"""\
             #!/bin/bash
             echo ECS_CLUSTER={cluster_name} >> /etc/ecs/ecs.config
         """)
-        ec2_user_data = pulumi.Output.all(ec2_user_data).apply(
-            lambda args: base64.b64encode(args[0].encode()).decode())
+        ec2_user_data = base64.b64encode(ec2_user_data.encode()).decode()
 
         self.launch_template = aws.ec2.LaunchTemplate(
-            self.resource_name_prefix + "launch-template",
+            prefix + "launch-template",
             iam_instance_profile=aws.ec2.LaunchTemplateIamInstanceProfileArgs(
                 arn=self.ecs_instance_profile.arn,
             ),
@@ -141,10 +157,10 @@ class Cluster(pulumi.ComponentResource):
             key_name=ec2_config.key_name,
             name=ec2_config.template_name,
             user_data=ec2_user_data,
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
         self.autoscaling_group = aws.autoscaling.Group(
-            self.resource_name_prefix + "autoscaling_group",
+            prefix + "autoscaling_group",
             desired_capacity=0,  # Scaling is handled by the Capacity Provider
             min_size=min_instance_count,
             max_size=max_instance_count,
@@ -154,16 +170,16 @@ class Cluster(pulumi.ComponentResource):
                 version="$Latest",
             ),
             protect_from_scale_in=True,
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
 
         self.cluster = aws.ecs.Cluster(
-            self.resource_name_prefix + "cluster",
+            prefix + "cluster",
             name=cluster_name,
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
         self.capacity_provider = aws.ecs.CapacityProvider(
-            self.resource_name_prefix + "capacity-provider",
+            prefix + "capacity-provider",
             auto_scaling_group_provider=aws.ecs.CapacityProviderAutoScalingGroupProviderArgs(
                 auto_scaling_group_arn=self.autoscaling_group.arn,
                 managed_termination_protection="ENABLED",
@@ -174,10 +190,10 @@ class Cluster(pulumi.ComponentResource):
                     target_capacity=10,
                 ),
             ),
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
         self.cluster_capacity_providers = aws.ecs.ClusterCapacityProviders(
-            self.resource_name_prefix + "cluster-capacity-provider",
+            prefix + "cluster-capacity-provider",
             cluster_name=self.cluster.name,
             capacity_providers=[self.capacity_provider.name],
             default_capacity_provider_strategies=[
@@ -185,7 +201,7 @@ class Cluster(pulumi.ComponentResource):
                     base=1,
                     weight=100,
                     capacity_provider=self.capacity_provider.name)],
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
 
 
@@ -222,9 +238,11 @@ class Service(pulumi.ComponentResource):
             self.resource_name_prefix,
             {},
             opts)
+        self._child_opts = pulumi.ResourceOptions(parent=self)
+        prefix = self.resource_name_prefix
 
         self.service = aws.ecs.Service(
-            self.resource_name_prefix + "-service",
+            prefix + "-service",
             cluster=cluster_arn,
             launch_type="EC2",
             desired_count=desired_task_count,
@@ -239,7 +257,7 @@ class Service(pulumi.ComponentResource):
                 container_name=container_name,
                 container_port=80,
             )],
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
 
 
@@ -272,36 +290,25 @@ class Task(pulumi.ComponentResource):
             self.resource_name_prefix,
             {},
             opts)
+        self._child_opts = pulumi.ResourceOptions(parent=self)
+        prefix = self.resource_name_prefix
 
         # IAM role:
         # - To allow the Task Definition to launch tasks on the cluster.
         self.task_execution_role = aws.iam.Role(
-            self.resource_name_prefix + "task-execution-role",
-            assume_role_policy=json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement":
-                    [
-                        {
-                            "Sid": "",
-                            "Effect": "Allow",
-                            "Principal": {"Service": "ecs-tasks.amazonaws.com"},
-                            "Action": "sts:AssumeRole"
-                        }
-                    ],
-                }
-            ),
-            opts=pulumi.ResourceOptions(parent=self)
+            prefix + "task-execution-role",
+            assume_role_policy=_ECS_TASKS_ASSUME_ROLE_POLICY,
+            opts=self._child_opts
         )
         self.task_execution_role_policy_attach = aws.iam.RolePolicyAttachment(
-            self.resource_name_prefix + "task-excution-policy-attach",
+            prefix + "task-excution-policy-attach",
             role=self.task_execution_role.name,
             policy_arn="arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy",
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
 
         self.task_definition = aws.ecs.TaskDefinition(
-            self.resource_name_prefix + "-task-definition",
+            prefix + "-task-definition",
             family=family_name,
             cpu="256",
             memory="512",
@@ -317,5 +324,5 @@ class Task(pulumi.ComponentResource):
                     "protocol": "tcp"
                 }]
             }]),
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
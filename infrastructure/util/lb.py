@@ -2,12 +2,25 @@
 
 """Load Balancer Component Resources"""
 
+import functools
 from typing import List
 
 import pulumi
 import pulumi_aws as aws
 
 
+@functools.lru_cache(maxsize=None)
+def _get_zone(name: str) -> aws.route53.GetZoneResult:
+    """Looks up a Route53 hosted zone, caching the result for this run."""
+    return aws.route53.get_zone(name=name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_certificate(domain: str) -> aws.acm.GetCertificateResult:
+    """Looks up an ACM certificate, caching the result for this run."""
+    return aws.acm.get_certificate(domain=domain)
+
+
 class LoadBalancer(pulumi.ComponentResource):
     """Load Balancer Component Resource"""
 
@@ -35,6 +48,8 @@ class LoadBalancer(pulumi.ComponentResource):
             self.resource_name_prefix,
             {},
             opts)
+        self._child_opts = pulumi.ResourceOptions(parent=self)
+        prefix = self.resource_name_prefix
 
         self.records = []
         self.target_groups = []
@@ -42,35 +57,29 @@ class LoadBalancer(pulumi.ComponentResource):
         self.listeners = []
 
         self.security_group = aws.ec2.SecurityGroup(
-            self.resource_name_prefix + "-sg",
+            prefix + "-sg",
             vpc_id=vpc_id,
             description="Inbound: Any HTTPS. Outbound: Any HTTP.",
-            opts=pulumi.ResourceOptions(parent=self)
-        )
-        aws.ec2.SecurityGroupRule(
-            self.resource_name_prefix + "-sg-ingress",
-            type="ingress",
-            from_port=443,
-            to_port=443,
-            protocol="tcp",
-            cidr_blocks=["0.0.0.0/0"],
-            ipv6_cidr_blocks=["::/0"],
-            security_group_id=self.security_group.id,
-            opts=pulumi.ResourceOptions(parent=self)
-        )
-        aws.ec2.SecurityGroupRule(
-            self.resource_name_prefix + "-sg-engress",
-            type="egress",
-            from_port=80,
-            to_port=80,
-            protocol="tcp",
-            cidr_blocks=["0.0.0.0/0"],
-            ipv6_cidr_blocks=["::/0"],
-            security_group_id=self.security_group.id,
-            opts=pulumi.ResourceOptions(parent=self)
+            ingress=[
+                aws.ec2.SecurityGroupIngressArgs(
+                    from_port=443,
+                    to_port=443,
+                    protocol="tcp",
+                    cidr_blocks=["0.0.0.0/0"],
+                    ipv6_cidr_blocks=["::/0"]),
+            ],
+            egress=[
+                aws.ec2.SecurityGroupEgressArgs(
+                    from_port=80,
+                    to_port=80,
+                    protocol="tcp",
+                    cidr_blocks=["0.0.0.0/0"],
+                    ipv6_cidr_blocks=["::/0"]),
+            ],
+            opts=self._child_opts
         )
 
-        alb_name = self.resource_name_prefix + "-alb"
+        alb_name = prefix + "-alb"
         self.alb = aws.lb.LoadBalancer(
             alb_name,
             name=alb_name,
@@ -79,7 +88,7 @@ class LoadBalancer(pulumi.ComponentResource):
             security_groups=[self.security_group.id],
             subnets=subnet_ids,
             idle_timeout=600,  # 10 minutes
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
 
     def add_dns_record(self, domain_name: str):
@@ -88,7 +97,7 @@ class LoadBalancer(pulumi.ComponentResource):
         Args:
             domain_name: Domain name to use for the DNS record.
         """
-        hosted_zone = aws.route53.get_zone(name=domain_name)
+        hosted_zone = _get_zone(domain_name)
         self.records.append(aws.route53.Record(
             self.resource_name_prefix + "-alb-record",
             zone_id=hosted_zone.id,
@@ -99,7 +108,7 @@ class LoadBalancer(pulumi.ComponentResource):
                 zone_id=self.alb.zone_id,
                 evaluate_target_health=True,
             )],
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         ))
 
     def add_target_group(
@@ -120,7 +129,7 @@ class LoadBalancer(pulumi.ComponentResource):
                 "path": health_check_path,
             },
             target_type="ip",
-            opts=pulumi.ResourceOptions(parent=self))
+            opts=self._child_opts)
         self.target_groups.append(target_group)
         return target_group
 
@@ -135,7 +144,7 @@ class LoadBalancer(pulumi.ComponentResource):
             certificate_domain: Domain name to use for the certificate.
             target_group: Target group to forward requests to.
         """
-        certificate = aws.acm.get_certificate(domain=certificate_domain)
+        certificate = _get_certificate(certificate_domain)
         listener = aws.lb.Listener(
             self.resource_name_prefix + "-listener",
             load_balancer_arn=self.alb.arn,
@@ -147,7 +156,7 @@ class LoadBalancer(pulumi.ComponentResource):
                 "target_group_arn": target_group.arn,
             }],
             certificate_arn=certificate.arn,
-            opts=pulumi.ResourceOptions(parent=self)
+            opts=self._child_opts
         )
         self.listeners.append(listener)
         return listener
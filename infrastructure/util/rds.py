@@ -51,9 +51,11 @@ class RDS(pulumi.ComponentResource):
             resource_name_prefix,
             {},
             opts)
+        self._child_opts = pulumi.ResourceOptions(parent=self)
+        prefix = self.resource_name_prefix
 
         self.security_group = aws.ec2.SecurityGroup(
-            self.resource_name_prefix + "-sg",
+            prefix + "-sg",
             vpc_id=vpc_id,
             ingress=[
                 aws.ec2.SecurityGroupIngressArgs(
@@ -62,18 +64,19 @@ class RDS(pulumi.ComponentResource):
                     protocol="tcp",
                     security_groups=access_security_groups),
             ],
-            opts=pulumi.ResourceOptions(parent=self))
+            opts=self._child_opts)
 
+        subnet_group_name = prefix + "-subnet-group"
         self.subnet_group = aws.rds.SubnetGroup(
-            self.resource_name_prefix + "-subnet-group",
+            subnet_group_name,
             subnet_ids=subnet_ids,
             tags={
-                "Name": self.resource_name_prefix + "-subnet-group",
+                "Name": subnet_group_name,
             },
-            opts=pulumi.ResourceOptions(parent=self))
+            opts=self._child_opts)
 
         self.cluster = aws.rds.Cluster(
-            self.resource_name_prefix + "-cluster",
+            prefix + "-cluster",
             # Credentials
             cluster_identifier=rds_config.cluster_identifier,
             database_name=rds_config.database_name,
@@ -91,9 +94,9 @@ class RDS(pulumi.ComponentResource):
             db_subnet_group_name=self.subnet_group.id,
             vpc_security_group_ids=[self.security_group.id],
             skip_final_snapshot=True,
-            opts=pulumi.ResourceOptions(parent=self))
+            opts=self._child_opts)
 
-        instance_identifier = self.resource_name_prefix + "-cluster-instance"
+        instance_identifier = prefix + "-cluster-instance"
         self.cluster_instance = aws.rds.ClusterInstance(
             instance_identifier,
             cluster_identifier=self.cluster.id,
@@ -101,4 +104,4 @@ class RDS(pulumi.ComponentResource):
             instance_class=rds_config.instance_class,
             engine=self.cluster.engine,
             engine_version=self.cluster.engine_version,
-            opts=pulumi.ResourceOptions(parent=self))
+            opts=self._child_opts)